@@ -1,14 +1,21 @@
-import json
+import asyncio
+import functools
+import itertools
 import logging
 import os
 import random
+import re
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 
+import aiohttp
 import numpy as np
-import requests
+import orjson
 from dotenv import load_dotenv
 from googleapiclient.discovery import build
-from PIL import Image as PILImage, ImageEnhance as PILImageEnhance, ImageOps
+from PIL import Image as PILImage, ImageFilter
 
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter
@@ -16,6 +23,13 @@ from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Image, Spacer, HRFlowable
 
+_ISO8601 = re.compile(r"^PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?$")
+_THUMBNAIL_VIDEO_ID = re.compile(r"/vi/([^/]+)/")
+_THUMBNAIL_CACHE_DIR = ".thumbcache"
+_THUMBNAIL_CACHE_MAX_AGE = 30 * 24 * 60 * 60  # Revalidate cached thumbnails monthly
+_BOLD_MARKUP = "<b>%s</b>"
+_LINK_MARKUP = '<a href="%s">%s</a>'
+
 
 def setup_logging(log_file_path="logfile.log"):
     """Configure logging to write to a specified file."""
@@ -48,72 +62,107 @@ def initialize_youtube_api():
     return youtube_client
 
 
-def fetch_youtube_videos(channel_id, category, excluded_keywords, max_results=7):
-    """Fetch YouTube videos from a specific channel and category, excluding Shorts, and organize them by category."""
-    logger.info(
-        "Fetching videos from channel '%s' for category '%s'.",
-        channel_id,
-        category["category_name"],
+def fetch_youtube_videos(pairs, excluded_keywords, max_results=7):
+    """Fetch YouTube videos for every (channel, category) pair, excluding Shorts, and organize them by category."""
+    logger.info("Fetching videos for %d channel/category pairs.", len(pairs))
+
+    search_results = fetch_search_results(pairs, max_results)
+    video_ids = list(
+        dict.fromkeys(
+            item["id"]["videoId"] for items in search_results.values() for item in items
+        )
     )
+    video_details = fetch_video_details(video_ids) if video_ids else {}
+
+    results = []
+    for index, (channel_id, category) in enumerate(pairs):
+        try:
+            items = search_results.get(str(index), [])
+            if not items:
+                logger.warning(
+                    "No videos found for channel '%s' in category '%s'.",
+                    channel_id,
+                    category["category_name"],
+                )
+            videos = build_videos(items, video_details)
+            categorized_videos = categorize_videos(videos, category, excluded_keywords)
 
-    keywords = category.get("keywords", [])
+        except Exception as err:
+            logger.error(
+                "An error occurred while fetching or categorizing videos: %s", err
+            )
+            categorized_videos = {"daily": [], "include": []}
 
-    try:
-        videos = fetch_videos_from_youtube(channel_id, keywords, max_results)
-        categorized_videos = categorize_videos(videos, category, excluded_keywords)
+        results.append(categorized_videos)
 
-    except Exception as err:
-        logger.error("An error occurred while fetching or categorizing videos: %s", err)
-        categorized_videos = {"daily": [], "include": []}
+    return results
 
-    return categorized_videos
 
+def fetch_search_results(pairs, max_results=7):
+    """Search every (channel, category) pair in a single batch request, keyed by pair index."""
+    logger.info("Searching videos for %d channel/category pairs.", len(pairs))
 
-def fetch_videos_from_youtube(channel_id, keywords, max_results=7):
-    """Fetch YouTube videos from a specific channel and query, excluding Shorts."""
-    logger.info(
-        "Fetching videos from channel '%s' with keywords: %s", channel_id, keywords
-    )
+    search_results = {}
+
+    def handle_response(request_id, response, exception):
+        if exception is not None:
+            logger.error(
+                "An error occurred while fetching videos for request %s: %s",
+                request_id,
+                exception,
+            )
+            return
+        search_results[request_id] = response.get("items", [])
 
     try:
-        search_response = (
-            youtube.search()
-            .list(
-                part="snippet",
-                channelId=channel_id,
-                q=" ".join(keywords),
-                type="video",
-                order="date",  # Latest videos first
-                maxResults=max_results,
-                videoDuration="long",  # >20 minutes. Could be also 'medium' (4-20 minutes). It's important to filter out Shorts.
+        batch = youtube.new_batch_http_request(callback=handle_response)
+        for index, (channel_id, category) in enumerate(pairs):
+            keywords = category.get("keywords", [])
+            logger.info(
+                "Fetching videos from channel '%s' with keywords: %s",
+                channel_id,
+                keywords,
             )
-            .execute()
-        )
+            batch.add(
+                youtube.search().list(
+                    part="snippet",
+                    channelId=channel_id,
+                    q=" ".join(keywords),
+                    type="video",
+                    order="date",  # Latest videos first
+                    maxResults=max_results,
+                    videoDuration="long",  # >20 minutes. Could be also 'medium' (4-20 minutes). It's important to filter out Shorts.
+                ),
+                request_id=str(index),
+            )
+        batch.execute()
+    except Exception as err:
+        logger.error("An error occurred while fetching videos: %s", err)
 
-        video_ids = [item["id"]["videoId"] for item in search_response.get("items", [])]
-        if not video_ids:
-            logger.warning("No videos found for the given query.")
-            return [], {}
+    logger.info("Fetched search results for %d pairs.", len(search_results))
+    return search_results
 
-        video_details = fetch_video_details(video_ids)
 
-        videos = [
-            {
-                "id": item["id"]["videoId"],
-                "title": item["snippet"]["title"],
-                "url": f"https://www.youtube.com/watch?v={item['id']['videoId']}",
-                "thumb": item["snippet"]["thumbnails"]["high"]["url"],
-                "duration": video_details.get(item["id"]["videoId"], 0),
-            }
-            for item in search_response.get("items", [])
-        ]
+def build_videos(items, video_details):
+    """Build video records from search result items and their fetched durations."""
+    return [
+        {
+            "id": item["id"]["videoId"],
+            "title": item["snippet"]["title"],
+            "url": f"https://www.youtube.com/watch?v={item['id']['videoId']}",
+            "thumb": item["snippet"]["thumbnails"]["high"]["url"],
+            "duration": video_details.get(item["id"]["videoId"], 0),
+        }
+        for item in items
+    ]
 
-        logger.info("Fetched %d videos from channel '%s'.", len(videos), channel_id)
-        return videos
 
-    except Exception as err:
-        logger.error("An error occurred while fetching videos: %s", err)
-        return []
+@functools.lru_cache(maxsize=32)
+def _compile_excluded_keywords(excluded_keywords):
+    """Compile excluded keywords into one case-insensitive pattern, or None if there are none."""
+    if not excluded_keywords:
+        return None
+    return re.compile("|".join(map(re.escape, excluded_keywords)), re.IGNORECASE)
 
 
 def categorize_videos(videos, category, excluded_keywords):
@@ -125,15 +174,18 @@ def categorize_videos(videos, category, excluded_keywords):
     )
 
     categorized_videos = {"daily": [], "include": []}
+    excluded_pattern = _compile_excluded_keywords(tuple(excluded_keywords))
 
     for video in videos:
         title = video.get("title")
         if not title:
-            logger.debug("Skipping video with missing title: %s", video)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Skipping video with missing title: %s", video)
             continue
 
-        if any(keyword in title.lower() for keyword in excluded_keywords):
-            logger.debug("Skipping video due to excluded keywords: %s", title)
+        if excluded_pattern and excluded_pattern.search(title):
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Skipping video due to excluded keywords: %s", title)
             continue
 
         if category.get("daily", False):
@@ -160,57 +212,58 @@ def categorize_videos(videos, category, excluded_keywords):
     return categorized_videos
 
 
-def fetch_video_details(video_ids):
-    """Fetch video details for multiple video IDs."""
+def fetch_video_details(video_ids, chunk_size=50):
+    """Fetch video details for multiple video IDs, batching up to 50 IDs per request."""
     logger.info("Fetching video details for IDs: %s", video_ids)
 
-    try:
-        video_response = (
-            youtube.videos()
-            .list(part="contentDetails", id=",".join(video_ids))
-            .execute()
-        )
+    details = {}
 
-        details = {
-            item["id"]: parse_duration_to_minutes(item["contentDetails"]["duration"])
-            for item in video_response.get("items", [])
-        }
-        logger.info("Fetched video details for %d videos.", len(details))
-        return details
+    def handle_response(request_id, response, exception):
+        if exception is not None:
+            logger.error(
+                "An error occurred while fetching video details for request %s: %s",
+                request_id,
+                exception,
+            )
+            return
+        for item in response.get("items", []):
+            details[item["id"]] = parse_duration_to_minutes(
+                item["contentDetails"]["duration"]
+            )
+
+    try:
+        batch = youtube.new_batch_http_request(callback=handle_response)
+        for start in range(0, len(video_ids), chunk_size):
+            chunk = video_ids[start : start + chunk_size]
+            batch.add(
+                youtube.videos().list(part="contentDetails", id=",".join(chunk)),
+                request_id=str(start),
+            )
+        batch.execute()
     except Exception as err:
         logger.error("An error occurred while fetching video details: %s", err)
-        return {}
+
+    logger.info("Fetched video details for %d videos.", len(details))
+    return details
 
 
+@functools.lru_cache(maxsize=4096)
 def parse_duration_to_minutes(duration):
     """Parse ISO 8601 duration format to minutes."""
-    logger.debug("Parsing duration: %s", duration)
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+    if debug_enabled:
+        logger.debug("Parsing duration: %s", duration)
 
-    if not duration.startswith("PT"):
+    match = _ISO8601.match(duration)
+    if not match:
         logger.warning("Unexpected duration format: %s", duration)
         return 0
 
-    duration = duration[2:]  # Remove 'PT' prefix
-    minutes = 0
-
-    try:
-        if "H" in duration:
-            hours, duration = duration.split("H", 1)
-            minutes += int(hours) * 60
-
-        if "M" in duration:
-            minutes_part, duration = duration.split("M", 1)
-            if minutes_part:
-                minutes += int(minutes_part)
-
-        if "S" in duration:
-            seconds = int(duration.replace("S", ""))
-            minutes += seconds // 60
-    except ValueError as e:
-        logger.error("Error parsing duration '%s': %s", duration, e)
-        return 0
+    hours, minutes, seconds = match.groups()
+    minutes = int(hours or 0) * 60 + int(minutes or 0) + int(seconds or 0) // 60
 
-    logger.debug("Parsed duration to minutes: %d", minutes)
+    if debug_enabled:
+        logger.debug("Parsed duration to minutes: %d", minutes)
     return minutes
 
 
@@ -246,15 +299,24 @@ def generate_week_schedule(
     daily_categories = categorized_videos.get("daily", [])
     weekly_categories = categorized_videos.get("include", [])
 
-    logger.debug("Daily categories: %s", daily_categories)
-    logger.debug("Weekly categories: %s", weekly_categories)
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+    if debug_enabled:
+        logger.debug("Daily categories: %s", daily_categories)
+        logger.debug("Weekly categories: %s", weekly_categories)
 
     week_schedule = {day: [] for day in all_days}
     all_weekly_videos = [
         video for video in weekly_categories if isinstance(video, dict)
     ]
 
-    logger.debug("All weekly videos: %s", all_weekly_videos)
+    if debug_enabled:
+        logger.debug("All weekly videos: %s", all_weekly_videos)
+
+    weekly_pool = [
+        video
+        for video in all_weekly_videos
+        if video.get("duration", 0) <= max_daily_duration
+    ]
 
     for day in available_days:
         day_videos = []
@@ -272,22 +334,22 @@ def generate_week_schedule(
                     daily_video["duration"],
                 )
 
-        available_weekly_videos = [
-            video
-            for video in all_weekly_videos
-            if video.get("duration", 0) <= max_daily_duration
-        ]
-        random.shuffle(available_weekly_videos)
-        logger.debug("Shuffled weekly videos: %s", available_weekly_videos)
+        order = list(range(len(weekly_pool)))
+        random.shuffle(order)
+        if debug_enabled:
+            logger.debug("Shuffled weekly video order: %s", order)
 
-        for video in available_weekly_videos:
+        selected = set()
+        for index in order:
             if (
                 len(day_videos) >= max_videos_per_day
                 or total_duration >= max_daily_duration
             ):
                 break
+            video = weekly_pool[index]
             if total_duration + video["duration"] <= max_daily_duration:
                 day_videos.append(video)
+                selected.add(index)
                 total_duration += video["duration"]
                 logger.info(
                     "Added weekly video for %s: %s (Duration: %d min)",
@@ -298,34 +360,37 @@ def generate_week_schedule(
 
         if len(day_videos) < min_videos_per_day or total_duration < min_daily_duration:
             remaining_videos = [
-                video for video in all_weekly_videos if video not in day_videos
+                weekly_pool[index] for index in order if index not in selected
             ]
-            random.shuffle(remaining_videos)
-            logger.debug(
-                "Remaining videos for additional allocation: %s", remaining_videos
-            )
+            if debug_enabled:
+                logger.debug(
+                    "Remaining videos for additional allocation: %s", remaining_videos
+                )
 
             while (
                 len(day_videos) < min_videos_per_day
+                and len(day_videos) < max_videos_per_day
                 and total_duration < max_daily_duration
                 and remaining_videos
             ):
-                valid_videos = [
-                    video
-                    for video in remaining_videos
+                valid_indices = [
+                    index
+                    for index, video in enumerate(remaining_videos)
                     if total_duration + video["duration"] <= max_daily_duration
                 ]
 
-                if not valid_videos:
+                if not valid_indices:
                     logger.info(
                         "No more valid videos to add without exceeding daily duration."
                     )
                     break
 
-                video = random.choice(valid_videos)
+                index = random.choice(valid_indices)
+                video = remaining_videos[index]
+                remaining_videos[index] = remaining_videos[-1]
+                remaining_videos.pop()
                 day_videos.append(video)
                 total_duration += video["duration"]
-                remaining_videos.remove(video)
                 logger.info(
                     "Added additional video for %s: %s (Duration: %d min)",
                     day,
@@ -333,7 +398,7 @@ def generate_week_schedule(
                     video["duration"],
                 )
 
-        week_schedule[day] = day_videos[:max_videos_per_day]
+        week_schedule[day] = day_videos
         logger.info(
             "Final schedule for %s: %d videos, total duration %d min",
             day,
@@ -344,36 +409,209 @@ def generate_week_schedule(
     return week_schedule
 
 
-def remove_black_borders(image, tolerance=30):
-    """Remove black borders from the top and bottom of an image."""
+def remove_black_borders(image, grayscale_image, tolerance=30):
+    """Remove black borders from the top and bottom of an image, detected on its grayscale copy."""
     logger.debug("Removing black borders with tolerance: %d", tolerance)
 
-    grayscale_image = ImageOps.grayscale(image)
-    image_array = np.array(grayscale_image)
-    mask = image_array < tolerance
-    non_black_rows = np.any(~mask, axis=1)
-    top = np.argmax(non_black_rows)
-    bottom = len(non_black_rows) - np.argmax(non_black_rows[::-1]) - 1
+    row_max = np.asarray(grayscale_image).max(axis=1)
+    non_black_rows = np.flatnonzero(row_max >= tolerance)
+    if non_black_rows.size == 0:
+        return image
 
-    return image.crop((0, top, image.width, bottom + 1))
+    top, bottom = int(non_black_rows[0]), int(non_black_rows[-1])
 
+    return image.crop((0, top, image.width, bottom + 1))
 
-def get_image_from_url(url):
-    """Get an image from a URL, remove black borders, and return it as a PIL Image."""
-    logger.info("Fetching image from URL: %s", url)
 
-    try:
-        response = requests.get(url)
-        response.raise_for_status()
-        content_type = response.headers.get("Content-Type")
-        if "image" not in content_type:
-            logger.error(
-                "URL does not point to an image. Content-Type: %s", content_type
+async def _fetch_thumbnail(session, url, validators=None, retries=3):
+    """Download a single thumbnail and return (bytes, validators), or None on failure.
+
+    When cached validators are given the request is conditional, and the bytes are
+    None if the server answers 304 Not Modified.
+    """
+    headers = {}
+    if validators:
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+
+    for attempt in range(1, retries + 1):
+        try:
+            async with session.get(url, headers=headers) as response:
+                if response.status == 304:
+                    return None, validators
+                response.raise_for_status()
+                content_type = response.headers.get("Content-Type", "")
+                if "image" not in content_type:
+                    logger.error(
+                        "URL does not point to an image. Content-Type: %s",
+                        content_type,
+                    )
+                    return None
+                response_validators = {
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                }
+                return await response.read(), response_validators
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+            logger.warning(
+                "Attempt %d/%d to download image from URL %s failed: %s",
+                attempt,
+                retries,
+                url,
+                e,
             )
+        except Exception as e:
+            logger.error("Error downloading image from URL %s: %s", url, e)
             return None
 
-        img = PILImage.open(BytesIO(response.content)).convert("RGB")
-        img = remove_black_borders(img)
+    logger.error("Giving up on image URL %s after %d attempts.", url, retries)
+    return None
+
+
+async def _fetch_all(pending):
+    """Download all thumbnails concurrently over a single keep-alive HTTP session.
+
+    Takes a mapping of URL to cached validators (or None) and returns a mapping of
+    URL to (bytes, validators) for every request that succeeded.
+    """
+    urls = list(pending)
+    connector = aiohttp.TCPConnector(limit=32, limit_per_host=8, keepalive_timeout=30)
+    timeout = aiohttp.ClientTimeout(total=10)
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        results = await asyncio.gather(
+            *(_fetch_thumbnail(session, url, pending[url]) for url in urls)
+        )
+    return {url: result for url, result in zip(urls, results) if result is not None}
+
+
+def _thumbnail_cache_path(url):
+    """Return the on-disk cache path for a thumbnail URL, or None if it has no video ID."""
+    match = _THUMBNAIL_VIDEO_ID.search(url)
+    if not match:
+        return None
+    return os.path.join(_THUMBNAIL_CACHE_DIR, f"{match.group(1)}.jpg")
+
+
+def _validators_path(cache_path):
+    """Return the path of the HTTP validators stored next to a cached thumbnail."""
+    return os.path.splitext(cache_path)[0] + ".json"
+
+
+@functools.lru_cache(maxsize=256)
+def _load_cached_thumbnail(cache_path):
+    """Read a cached thumbnail from disk and return (bytes, is_fresh).
+
+    Raises OSError if the thumbnail is not cached.
+    """
+    with open(cache_path, "rb") as file:
+        age = time.time() - os.fstat(file.fileno()).st_mtime
+        return file.read(), age < _THUMBNAIL_CACHE_MAX_AGE
+
+
+def _load_cached_validators(cache_path):
+    """Read the ETag/Last-Modified validators of a cached thumbnail, if any."""
+    try:
+        with open(_validators_path(cache_path), "rb") as file:
+            return orjson.loads(file.read())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+
+
+def _write_cache_file(path, data):
+    """Atomically write a cache file so an interrupted run never leaves it truncated."""
+    fd, temp_path = tempfile.mkstemp(dir=_THUMBNAIL_CACHE_DIR, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(data)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+
+def _save_cached_thumbnail(cache_path, data, validators):
+    """Write a downloaded thumbnail and its validators to the on-disk cache."""
+    try:
+        os.makedirs(_THUMBNAIL_CACHE_DIR, exist_ok=True)
+        _write_cache_file(cache_path, data)
+        _write_cache_file(_validators_path(cache_path), orjson.dumps(validators))
+    except OSError as e:
+        logger.warning("Could not cache thumbnail at %s: %s", cache_path, e)
+
+
+def fetch_thumbnails(urls):
+    """Prefetch the raw bytes of every thumbnail URL, keyed by URL, using the disk cache when possible."""
+    logger.info("Prefetching %d thumbnails.", len(urls))
+
+    thumbnails = {}
+    stale_thumbnails = {}
+    pending = {}
+    for url in urls:
+        cache_path = _thumbnail_cache_path(url)
+        validators = None
+        if cache_path:
+            try:
+                data, is_fresh = _load_cached_thumbnail(cache_path)
+            except OSError:
+                pass
+            else:
+                if is_fresh:
+                    thumbnails[url] = data
+                    continue
+                stale_thumbnails[url] = data
+                validators = _load_cached_validators(cache_path)
+        pending[url] = validators
+
+    logger.info("Loaded %d thumbnails from cache.", len(thumbnails))
+
+    if pending:
+        responses = asyncio.run(_fetch_all(pending))
+        revalidated = 0
+        for url, (data, validators) in responses.items():
+            cache_path = _thumbnail_cache_path(url)
+            if data is None:
+                data = stale_thumbnails[url]
+                try:
+                    os.utime(cache_path)
+                except OSError as e:
+                    logger.warning("Could not refresh thumbnail %s: %s", cache_path, e)
+                revalidated += 1
+            elif cache_path:
+                _save_cached_thumbnail(cache_path, data, validators)
+            thumbnails[url] = data
+        _load_cached_thumbnail.cache_clear()
+        logger.info("Revalidated %d cached thumbnails.", revalidated)
+
+        for url, data in stale_thumbnails.items():
+            if url not in responses:
+                logger.warning("Could not revalidate %s, using stale cached copy.", url)
+                thumbnails[url] = data
+
+    logger.info("Prefetched %d of %d thumbnails.", len(thumbnails), len(urls))
+    return thumbnails
+
+
+def get_image_from_url(url, thumbnails):
+    """Decode a prefetched thumbnail, remove black borders, and return it as a PIL Image."""
+    logger.info("Loading image for URL: %s", url)
+
+    data = thumbnails.get(url)
+    if data is None:
+        logger.error("No prefetched image available for URL: %s", url)
+        return None
+
+    try:
+        img = PILImage.open(BytesIO(data))
+        img.draft("RGB", (400, 400))  # Let libjpeg decode at a reduced scale
+        img = img.convert("RGB")
+
+        grayscale_img = PILImage.open(BytesIO(data))
+        grayscale_img.draft("L", (400, 400))  # Decode only the luma channel
+        grayscale_img = grayscale_img.convert("L")
+
+        img = remove_black_borders(img, grayscale_img)
         return img
     except Exception as e:
         logger.error("Error loading image from URL %s: %s", url, e)
@@ -384,24 +622,50 @@ def resize_image(image, max_width, max_height):
     """Resize image while maintaining aspect ratio with high quality."""
     logger.debug("Resizing image to fit within %d x %d", max_width, max_height)
 
-    original_width, original_height = image.size
-    aspect_ratio = original_width / original_height
+    if image.width > max_width or image.height > max_height:
+        image.thumbnail((max_width, max_height), PILImage.LANCZOS)
+        image = image.filter(ImageFilter.UnsharpMask(radius=1, percent=50))
 
-    if original_width > max_width or original_height > max_height:
-        if (max_width / max_height) > aspect_ratio:
-            new_width = int(max_height * aspect_ratio)
-            new_height = max_height
-        else:
-            new_width = max_width
-            new_height = int(max_width / aspect_ratio)
+    return image
 
-        new_width = int(new_width)
-        new_height = int(new_height)
-        image = image.resize((new_width, new_height), resample=PILImage.LANCZOS)
-        enhancer = PILImageEnhance.Sharpness(image)
-        image = enhancer.enhance(1.5)
 
-    return image
+def process_thumbnail(url, thumbnails, max_width, max_height):
+    """Crop and resize a prefetched thumbnail and return it encoded as JPEG bytes."""
+    img = get_image_from_url(url, thumbnails)
+    if img is None:
+        return None
+
+    try:
+        img = resize_image(img, max_width, max_height)
+        buffer = BytesIO()
+        img.save(buffer, format="JPEG", quality=85, optimize=True)
+        return buffer.getvalue()
+    except Exception as e:
+        logger.error("Error processing image from URL %s: %s", url, e)
+        return None
+
+
+def prepare_thumbnails(urls, max_width, max_height):
+    """Fetch every thumbnail and process them in parallel, returning JPEG bytes keyed by URL."""
+    thumbnails = fetch_thumbnails(urls)
+    urls = [url for url in urls if url in thumbnails]
+
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+        processed = pool.map(
+            functools.partial(
+                process_thumbnail,
+                thumbnails=thumbnails,
+                max_width=max_width,
+                max_height=max_height,
+            ),
+            urls,
+        )
+        thumb_cache = {
+            url: data for url, data in zip(urls, processed) if data is not None
+        }
+
+    logger.info("Processed %d thumbnails.", len(thumb_cache))
+    return thumb_cache
 
 
 def save_schedule_as_pdf(
@@ -465,10 +729,19 @@ def save_schedule_as_pdf(
         fontName="Helvetica",
     )
 
-    header = Paragraph("<b>WEEKLY WORKOUT ROUTINE</b>", pdf_title_style)
+    header = Paragraph(_BOLD_MARKUP % "WEEKLY WORKOUT ROUTINE", pdf_title_style)
     elements.append(header)
     elements.append(Spacer(1, 12))
 
+    thumb_cache = {}
+    if show_thumbnail:
+        thumb_urls = list(
+            dict.fromkeys(
+                video["thumb"] for videos in schedule.values() for video in videos
+            )
+        )
+        thumb_cache = prepare_thumbnails(thumb_urls, 2 * inch, 2 * inch)
+
     pastel_colors = [
         colors.pink,
         colors.lightblue,
@@ -486,7 +759,7 @@ def save_schedule_as_pdf(
         else:
             duration_text = f" ({total_duration} min)"
 
-        day_heading = Paragraph(f"<b>{day}</b>", day_heading_style)
+        day_heading = Paragraph(_BOLD_MARKUP % day, day_heading_style)
         elements.append(day_heading)
 
         if show_duration:
@@ -502,15 +775,10 @@ def save_schedule_as_pdf(
 
             if show_thumbnail:
                 try:
-                    img = get_image_from_url(video_thumb_url)
-                    if img:
-                        img = resize_image(img, 2 * inch, 2 * inch)
-                        buffer = BytesIO()
-                        img.save(buffer, format="JPEG", quality=95)
-                        buffer.seek(0)
-                        thumb_image = Image(buffer)
-                        thumb_image.drawHeight = img.height
-                        thumb_image.drawWidth = img.width
+                    thumb_data = thumb_cache.get(video_thumb_url)
+                    if thumb_data:
+                        # JPEG data is embedded as-is, without another encode
+                        thumb_image = Image(BytesIO(thumb_data))
                         thumb_image.hAlign = "LEFT"
                         elements.append(thumb_image)
                         logger.info("Added thumbnail for video: %s", video_title)
@@ -524,10 +792,10 @@ def save_schedule_as_pdf(
                     elements.append(Spacer(1, 8))
 
             video_title_paragraph = Paragraph(
-                f"<b>{video_title}</b>", video_title_style
+                _BOLD_MARKUP % video_title, video_title_style
             )
             video_url_paragraph = Paragraph(
-                f'<a href="{video_url}">{video_url}</a>', video_url_style
+                _LINK_MARKUP % (video_url, video_url), video_url_style
             )
             elements.append(video_title_paragraph)
             elements.append(video_url_paragraph)
@@ -552,9 +820,9 @@ def main():
     logger.info("Starting script execution.")
 
     try:
-        with open("input_data.json", "r") as file:
-            data = json.load(file)
-    except (FileNotFoundError, json.JSONDecodeError) as e:
+        with open("input_data.json", "rb") as file:
+            data = orjson.loads(file.read())
+    except (FileNotFoundError, orjson.JSONDecodeError) as e:
         logger.error("Error loading input data: %s", e)
         return
 
@@ -563,30 +831,31 @@ def main():
     youtube_channels = data.get("youtube_channels", [])
     exercise_categories = data.get("exercise_categories", [])
 
-    for channel in youtube_channels:
-        if channel.get("include"):
-            channel_id = channel.get("channel_id")
-            for category in exercise_categories:
-                if category.get("include"):
-                    try:
-                        category_videos = fetch_youtube_videos(
-                            channel_id, category, excluded_keywords
-                        )
-                        categorized_videos["daily"].extend(
-                            category_videos.get("daily", [])
-                        )
-                        categorized_videos["include"].extend(
-                            category_videos.get("include", [])
-                        )
-                    except Exception as e:
-                        logger.error(
-                            "Error fetching videos for channel %s, category %s: %s",
-                            channel_id,
-                            category.get("category_name", "Unknown"),
-                            e,
-                        )
-
-    total_videos = len(categorized_videos["daily"]) + len(categorized_videos["include"])
+    active_channels = [
+        channel.get("channel_id")
+        for channel in youtube_channels
+        if channel.get("include")
+    ]
+    active_categories = [
+        category for category in exercise_categories if category.get("include")
+    ]
+    pairs = list(itertools.product(active_channels, active_categories))
+
+    seen_urls = set()
+    total_videos = 0
+
+    try:
+        for category_videos in fetch_youtube_videos(pairs, excluded_keywords):
+            for key in ("daily", "include"):
+                for video in category_videos.get(key, []):
+                    total_videos += 1
+                    if video["url"] in seen_urls:
+                        continue
+                    seen_urls.add(video["url"])
+                    categorized_videos[key].append(video)
+    except Exception as e:
+        logger.error("Error fetching videos: %s", e)
+
     logger.info("Number of videos fetched: %d", total_videos)
 
     if total_videos == 0:
@@ -595,21 +864,10 @@ def main():
         )
         return
 
-    unique_videos = {}
-    for category, videos in categorized_videos.items():
-        for video in videos:
-            unique_videos[video["url"]] = (video, category)
-
-    categorized_videos = {
-        "daily": [video for video, cat in unique_videos.values() if cat == "daily"],
-        "include": [video for video, cat in unique_videos.values() if cat == "include"],
-    }
-
-    unique_total_videos = len(categorized_videos["daily"]) + len(
-        categorized_videos["include"]
-    )
+    unique_total_videos = len(seen_urls)
     logger.info("Number of unique videos: %d", unique_total_videos)
-    logger.debug("Categorized videos: %s", categorized_videos)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Categorized videos: %s", categorized_videos)
 
     if unique_total_videos == 0:
         logger.warning("No unique videos available after deduplication.")